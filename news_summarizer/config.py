@@ -19,6 +19,15 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+    OPENAI_STREAM = os.getenv("OPENAI_STREAM", "false").lower() == "true"
+    
+    # Model routing: short items go to the fast model, long ones to the strong model.
+    # Unset, both routes use OPENAI_MODEL with 200 tokens, matching unrouted behaviour.
+    OPENAI_FAST_MODEL = os.getenv("OPENAI_FAST_MODEL", OPENAI_MODEL)
+    OPENAI_STRONG_MODEL = os.getenv("OPENAI_STRONG_MODEL", OPENAI_MODEL)
+    ROUTING_LONG_INPUT_CHARS = int(os.getenv("ROUTING_LONG_INPUT_CHARS", "1500"))
+    STRONG_MAX_TOKENS = int(os.getenv("STRONG_MAX_TOKENS", "200"))
+    FAST_MAX_TOKENS = int(os.getenv("FAST_MAX_TOKENS", str(STRONG_MAX_TOKENS)))
     
     # Scraping Settings
     MAX_ARTICLES = int(os.getenv("MAX_ARTICLES", "10"))
@@ -0,0 +1,226 @@
+"""
+Daily digest formatting and progressive output.
+"""
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+# Marker for "echo to whatever sys.stdout is when the writer is created"
+_STDOUT = object()
+
+
+def format_digest_header(total_articles: int) -> str:
+    """
+    Format the heading block of a daily digest.
+
+    Args:
+        total_articles: Number of articles the digest will contain
+
+    Returns:
+        Markdown for the digest header
+    """
+    header = "# Daily News Digest\n\n"
+    header += f"Total Articles: {total_articles}\n\n"
+    header += "---\n\n"
+    return header
+
+
+def format_section_heading(idx: int, article: Dict[str, str]) -> str:
+    """
+    Format the title and source lines of an article section.
+
+    Args:
+        idx: 1-based position of the article in the digest
+        article: Article dictionary
+
+    Returns:
+        Markdown for the start of the article section
+    """
+    heading = f"## {idx}. {article.get('title', 'No title')}\n\n"
+
+    if article.get('url'):
+        heading += f"**Source:** {article['url']}\n\n"
+
+    return heading
+
+
+def format_digest_section(idx: int, article: Dict[str, str]) -> str:
+    """
+    Format a single article section of a daily digest.
+
+    Args:
+        idx: 1-based position of the article in the digest
+        article: Article dictionary with an optional summary
+
+    Returns:
+        Markdown for the article section
+    """
+    section = format_section_heading(idx, article)
+
+    if article.get('summary'):
+        section += f"**Summary:** {article['summary']}\n\n"
+
+    section += "---\n\n"
+    return section
+
+
+class DigestWriter:
+    """Writes a daily digest progressively as summaries are produced."""
+
+    def __init__(self, output_file: Path, total_articles: int, echo: Optional[TextIO] = _STDOUT):
+        """
+        Initialize the digest writer.
+
+        Sections are appended to a temporary file next to ``output_file`` and
+        flushed immediately; the temporary file is renamed onto
+        ``output_file`` only once the digest is complete.
+
+        Args:
+            output_file: Final path of the digest
+            total_articles: Number of articles the digest will contain
+            echo: Stream to mirror each section to (defaults to sys.stdout), or None to disable
+        """
+        self.output_file = Path(output_file)
+        self.total_articles = total_articles
+        self.echo = sys.stdout if echo is _STDOUT else echo
+        self.sections_written = 0
+        self._file = None
+        self._tmp_path = None
+        self._streamed = ""
+        self._pending_whitespace = ""
+
+    def open(self):
+        """Create the temporary file and write the digest header."""
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{self.output_file.name}.",
+            suffix=".tmp",
+            dir=self.output_file.parent
+        )
+        self._tmp_path = Path(tmp_path)
+        self._file = os.fdopen(fd, 'w', encoding='utf-8')
+
+        if self.echo:
+            self.echo.write("\n" + "="*80 + "\n")
+        self._write(format_digest_header(self.total_articles))
+
+    def write_article(self, article: Dict[str, str]):
+        """
+        Append a summarized article to the digest.
+
+        Args:
+            article: Article dictionary with a summary
+        """
+        self.start_article(article)
+        self.finish_article(article.get('summary', ''))
+
+    def start_article(self, article: Dict[str, str]):
+        """
+        Begin a new article section, before its summary is available.
+
+        Args:
+            article: Article dictionary (title, url)
+        """
+        self.sections_written += 1
+        self._streamed = ""
+        self._pending_whitespace = ""
+        self._write(format_section_heading(self.sections_written, article))
+
+    def write_summary_chunk(self, text: str):
+        """
+        Append part of a summary to the current section as it streams in.
+
+        Leading and trailing whitespace of the whole summary is dropped so the
+        result matches the stripped summary written by ``finish_article``.
+
+        Args:
+            text: Next piece of summary text
+        """
+        stripped = text.rstrip()
+        tail = text[len(stripped):]
+
+        if not self._streamed:
+            stripped = stripped.lstrip()
+            if stripped:
+                self._write("**Summary:** ")
+            self._pending_whitespace = ""
+
+        if stripped:
+            self._write(self._pending_whitespace + stripped)
+            self._streamed += self._pending_whitespace + stripped
+            self._pending_whitespace = tail
+        elif self._streamed:
+            self._pending_whitespace += tail
+
+    def finish_article(self, summary: str):
+        """
+        Close the current article section.
+
+        If the summary was not streamed, it is written here in full. If it was
+        streamed but the final summary differs (e.g. the request failed part
+        way through), the final summary is written after the partial text.
+
+        Args:
+            summary: Final summary of the article
+        """
+        if self._streamed:
+            self._write("\n\n")
+            if summary and summary != self._streamed:
+                self._write(f"**Summary:** {summary}\n\n")
+        elif summary:
+            self._write(f"**Summary:** {summary}\n\n")
+
+        self._write("---\n\n")
+        self._streamed = ""
+        self._pending_whitespace = ""
+
+    def commit(self):
+        """Close the temporary file and atomically move it into place."""
+        self._file.close()
+        # mkstemp creates the file as 0600; give the digest the permissions a
+        # normally created file would have before publishing it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(self._tmp_path, 0o666 & ~umask)
+        os.replace(self._tmp_path, self.output_file)
+        self._file = None
+        self._tmp_path = None
+
+        if self.echo:
+            self.echo.write("="*80 + "\n\n")
+            self.echo.flush()
+        logger.info(f"Daily digest saved to: {self.output_file}")
+
+    def abort(self):
+        """Close and remove the temporary file without publishing it."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._tmp_path:
+            self._tmp_path.unlink(missing_ok=True)
+            self._tmp_path = None
+
+    def _write(self, text: str):
+        """Write text to the temporary file and the echo stream."""
+        self._file.write(text)
+        self._file.flush()
+        if self.echo:
+            self.echo.write(text)
+            self.echo.flush()
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
@@ -7,6 +7,8 @@ from datetime import datetime
 from pathlib import Path
 
 from .config import Config
+from .digest import DigestWriter
+from .router import ModelRouter
 from .scraper import GroundNewsScraper
 from .summarizer import ArticleSummarizer
 
@@ -15,7 +17,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout),
+        logging.StreamHandler(sys.stderr),  # keep stdout for the digest itself
         logging.FileHandler('news_summarizer.log')
     ]
 )
@@ -71,30 +73,35 @@ def main():
             
             # Initialize summarizer
             logger.info("Initializing article summarizer...")
+            router = ModelRouter(
+                fast_model=Config.OPENAI_FAST_MODEL,
+                strong_model=Config.OPENAI_STRONG_MODEL,
+                long_input_chars=Config.ROUTING_LONG_INPUT_CHARS,
+                fast_max_tokens=Config.FAST_MAX_TOKENS,
+                strong_max_tokens=Config.STRONG_MAX_TOKENS
+            )
             summarizer = ArticleSummarizer(
                 api_key=Config.OPENAI_API_KEY,
-                model=Config.OPENAI_MODEL
+                model=Config.OPENAI_MODEL,
+                stream=Config.OPENAI_STREAM,
+                router=router
             )
             
-            # Summarize articles
-            logger.info("Summarizing articles...")
-            summarized_articles = summarizer.summarize_articles(articles)
-            
-            # Create daily digest
-            logger.info("Creating daily digest...")
-            digest = summarizer.create_daily_digest(summarized_articles)
-            
-            # Save digest to file
+            # Summarize articles, writing each digest section (and, when
+            # streaming, each piece of its summary) as soon as it arrives
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = Config.OUTPUT_DIR / f"news_digest_{timestamp}.md"
             
-            output_file.write_text(digest, encoding='utf-8')
-            logger.info(f"Daily digest saved to: {output_file}")
+            logger.info("Summarizing articles into daily digest...")
+            with DigestWriter(output_file, total_articles=len(articles)) as writer:
+                for summarized_article in summarizer.iter_summarized_articles(
+                    articles,
+                    on_start=writer.start_article,
+                    on_delta=writer.write_summary_chunk
+                ):
+                    writer.finish_article(summarized_article['summary'])
             
-            # Print digest to console
-            print("\n" + "="*80)
-            print(digest)
-            print("="*80 + "\n")
+            router.log_stats()
             
             logger.info("News Summarizer completed successfully!")
             
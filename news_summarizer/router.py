@@ -0,0 +1,94 @@
+"""
+Model routing and per-route latency/token statistics.
+"""
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRouter:
+    """Picks a model and token budget for each article based on its input size."""
+
+    def __init__(self, fast_model: str, strong_model: str, long_input_chars: int = 1500,
+                 fast_max_tokens: int = 200, strong_max_tokens: int = 200):
+        """
+        Initialize the model router.
+
+        Args:
+            fast_model: Model for short items (title/description only)
+            strong_model: Model for long items (full article content)
+            long_input_chars: Input length at which an item is routed to the strong model
+            fast_max_tokens: Completion token limit for the fast route
+            strong_max_tokens: Completion token limit for the strong route
+        """
+        self.long_input_chars = long_input_chars
+        self.routes = {
+            "fast": {"model": fast_model, "max_tokens": fast_max_tokens},
+            "strong": {"model": strong_model, "max_tokens": strong_max_tokens},
+        }
+        self.stats = {
+            name: {"calls": 0, "latency": 0.0, "prompt_tokens": 0,
+                   "completion_tokens": 0, "cached_tokens": 0}
+            for name in self.routes
+        }
+
+    def route(self, article_text: str) -> str:
+        """
+        Choose a route for an article.
+
+        Input length is the routing signal: text at or past the threshold
+        (in practice, items with full article content) goes to the strong
+        model, and everything shorter, including title-only items, goes to
+        the fast model.
+
+        Args:
+            article_text: Prepared text that will be sent to the model
+
+        Returns:
+            Name of the chosen route
+        """
+        if len(article_text) >= self.long_input_chars:
+            return "strong"
+        return "fast"
+
+    def record(self, route_name: str, latency: float, usage: Optional[object] = None):
+        """
+        Record the latency and token usage of a completed call.
+
+        Args:
+            route_name: Route the call was made on
+            latency: Wall-clock seconds the call took
+            usage: Usage object returned by the OpenAI API, if any
+        """
+        stats = self.stats[route_name]
+        stats["calls"] += 1
+        stats["latency"] += latency
+
+        if usage is not None:
+            stats["prompt_tokens"] += usage.prompt_tokens or 0
+            stats["completion_tokens"] += usage.completion_tokens or 0
+            details = getattr(usage, "prompt_tokens_details", None)
+            if details is not None:
+                stats["cached_tokens"] += getattr(details, "cached_tokens", 0) or 0
+
+    def log_stats(self):
+        """
+        Log per-route call counts, mean latency and token usage.
+
+        Cached tokens are only reported by the provider once the shared
+        prompt prefix exceeds its caching minimum (1024 tokens for OpenAI),
+        so they stay at 0 for the current short summarization prompt.
+        """
+        for name, stats in self.stats.items():
+            if not stats["calls"]:
+                continue
+            route = self.routes[name]
+            mean_latency = stats["latency"] / stats["calls"]
+            logger.info(
+                f"Route '{name}' ({route['model']}, max_tokens={route['max_tokens']}): "
+                f"{stats['calls']} calls, mean latency {mean_latency:.2f}s, "
+                f"{stats['prompt_tokens']} prompt tokens "
+                f"({stats['cached_tokens']} cached), "
+                f"{stats['completion_tokens']} completion tokens"
+            )
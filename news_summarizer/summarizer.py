@@ -2,34 +2,57 @@
 LLM-based article summarization using OpenAI API.
 """
 import logging
-from typing import List, Dict
+import time
+from typing import Callable, List, Dict, Iterator, Optional, Tuple
 from openai import OpenAI
 
 from .config import Config
+from .digest import format_digest_header, format_digest_section
+from .router import ModelRouter
 
 logger = logging.getLogger(__name__)
 
+# Static part of every request. The system message and instructions come
+# before the article text so the prompt prefix is identical across calls.
+SYSTEM_PROMPT = "You are a helpful assistant that summarizes news articles concisely and accurately."
+
+SUMMARY_INSTRUCTIONS = """Please provide a concise summary of the following news article. 
+Include the main points and key takeaways in 2-3 sentences."""
+
 
 class ArticleSummarizer:
     """Summarizes news articles using OpenAI's LLM."""
     
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
+    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo", stream: bool = False,
+                 router: Optional[ModelRouter] = None):
         """
         Initialize the article summarizer.
         
         Args:
             api_key: OpenAI API key
-            model: OpenAI model to use for summarization
+            model: OpenAI model to use for summarization when no router is given
+            stream: Whether to request streamed completions from the API
+            router: Router choosing the model and token limit per article
         """
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.stream = stream
+        self.router = router or ModelRouter(
+            fast_model=model,
+            strong_model=model,
+            long_input_chars=Config.ROUTING_LONG_INPUT_CHARS,
+            fast_max_tokens=Config.FAST_MAX_TOKENS,
+            strong_max_tokens=Config.STRONG_MAX_TOKENS
+        )
         
-    def summarize_article(self, article: Dict[str, str]) -> str:
+    def summarize_article(self, article: Dict[str, str],
+                          on_delta: Optional[Callable[[str], None]] = None) -> str:
         """
         Summarize a single article.
         
         Args:
             article: Dictionary containing article information (title, url, description, content)
+            on_delta: Called with each piece of summary text as it arrives when streaming
             
         Returns:
             Summary of the article
@@ -45,27 +68,41 @@ class ArticleSummarizer:
                 article_text += f"Content: {article['content'][:4000]}\n"  # Limit content length
             
             # Create the prompt
-            prompt = f"""Please provide a concise summary of the following news article. 
-Include the main points and key takeaways in 2-3 sentences.
+            prompt = f"""{SUMMARY_INSTRUCTIONS}
 
 {article_text}
 
 Summary:"""
             
+            # Pick a model and token budget for this article
+            route_name = self.router.route(article_text)
+            route = self.router.routes[route_name]
+            
             # Call OpenAI API
-            logger.info(f"Summarizing article: {article.get('title', 'Unknown')[:50]}...")
+            logger.info(f"Summarizing article ({route_name} route): {article.get('title', 'Unknown')[:50]}...")
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            request = dict(
+                model=route['model'],
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that summarizes news articles concisely and accurately."},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=200,
+                max_tokens=route['max_tokens'],
                 temperature=0.5
             )
+            if self.stream:
+                request.update(stream=True, stream_options={"include_usage": True})
+            
+            start = time.perf_counter()
+            response = self.client.chat.completions.create(**request)
             
-            summary = response.choices[0].message.content.strip()
+            if self.stream:
+                summary, usage = self._collect_stream(response, on_delta)
+            else:
+                summary = response.choices[0].message.content.strip()
+                usage = response.usage
+            
+            self.router.record(route_name, time.perf_counter() - start, usage)
             logger.info("Summary generated successfully")
             
             return summary
@@ -74,25 +111,64 @@ Summary:"""
             logger.error(f"Error summarizing article: {e}")
             return f"Error generating summary: {str(e)}"
     
-    def summarize_articles(self, articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    def _collect_stream(self, response,
+                        on_delta: Optional[Callable[[str], None]] = None) -> Tuple[str, Optional[object]]:
         """
-        Summarize multiple articles.
+        Join the content deltas of a streamed completion.
         
         Args:
-            articles: List of article dictionaries
+            response: Streamed chat completion from the OpenAI client
+            on_delta: Called with each content delta as soon as it is received
             
         Returns:
-            List of articles with summaries added
+            Tuple of the full completion text and the usage reported in the final chunk
+        """
+        parts = []
+        usage = None
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                if on_delta:
+                    on_delta(chunk.choices[0].delta.content)
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+        return "".join(parts).strip(), usage
+    
+    def iter_summarized_articles(self, articles: List[Dict[str, str]],
+                                 on_start: Optional[Callable[[Dict[str, str]], None]] = None,
+                                 on_delta: Optional[Callable[[str], None]] = None) -> Iterator[Dict[str, str]]:
         """
-        summarized_articles = []
+        Summarize multiple articles, yielding each one as soon as it is done.
         
+        Args:
+            articles: List of article dictionaries
+            on_start: Called with each article just before it is summarized
+            on_delta: Called with each piece of summary text as it arrives when streaming
+            
+        Yields:
+            Copy of each article with its summary added
+        """
         for idx, article in enumerate(articles, 1):
             logger.info(f"Processing article {idx}/{len(articles)}")
-            summary = self.summarize_article(article)
+            if on_start:
+                on_start(article)
+            summary = self.summarize_article(article, on_delta)
             
             summarized_article = article.copy()
             summarized_article['summary'] = summary
-            summarized_articles.append(summarized_article)
+            yield summarized_article
+    
+    def summarize_articles(self, articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Summarize multiple articles.
+        
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            List of articles with summaries added
+        """
+        summarized_articles = list(self.iter_summarized_articles(articles))
         
         logger.info(f"Completed summarization of {len(summarized_articles)} articles")
         return summarized_articles
@@ -107,19 +183,9 @@ Summary:"""
         Returns:
             Formatted daily digest as string
         """
-        digest = "# Daily News Digest\n\n"
-        digest += f"Total Articles: {len(articles)}\n\n"
-        digest += "---\n\n"
+        digest = format_digest_header(len(articles))
         
         for idx, article in enumerate(articles, 1):
-            digest += f"## {idx}. {article.get('title', 'No title')}\n\n"
-            
-            if article.get('url'):
-                digest += f"**Source:** {article['url']}\n\n"
-            
-            if article.get('summary'):
-                digest += f"**Summary:** {article['summary']}\n\n"
-            
-            digest += "---\n\n"
+            digest += format_digest_section(idx, article)
         
         return digest
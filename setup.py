@@ -31,7 +31,7 @@ setup(
         "selenium>=4.15.0",
         "webdriver-manager>=4.0.1",
         "python-dotenv>=1.0.0",
-        "openai>=1.3.0",
+        "openai>=1.26.0",
         "beautifulsoup4>=4.12.0",
         "requests>=2.31.0",
     ],